@@ -12,13 +12,18 @@
 from __future__ import annotations
 
 import abc
+import linecache
 import os
-from inspect import stack, getframeinfo, Traceback
+import sys
+import weakref
+from functools import lru_cache, partial
+from inspect import Traceback, getattr_static
 from os import path
+from types import FrameType, CodeType, MethodType
 from typing import Type, ClassVar, TypeVar, Final, Callable, Optional, Union, final, Tuple, AnyStr, \
-	List
+	List, Dict, Any
 
-from SEPModules.SEPDecorators import copy_func_attrs, lock
+from SEPModules.SEPDecorators import WRAPPER_PREFIX, lock
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ GLOBALS ~~~~~~~~~~~~~~~
@@ -27,6 +32,15 @@ from SEPModules.SEPDecorators import copy_func_attrs, lock
 _T: Final = TypeVar("_T")
 """ Generic type variable for use in the :py:mod:`SEPUtils` module. """
 
+_TRACEBACK_CACHE_SIZE: Final[int] = 4096
+""" The maximum number of tracebacks kept in :py:data:`_TRACEBACK_CACHE`. """
+
+_TRACEBACK_CACHE: Final[Dict[Tuple[int, int, AnyStr], Tuple[weakref.ref, Traceback]]] = dict()
+"""
+Tracebacks created by :py:class:`StackFrameInfo` keyed by the id of the code object, last instruction, and working
+directory. Each traceback is stored with a weak reference to its code object, so that the cache keeps no code alive.
+"""
+
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ CLASSES ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -35,6 +49,20 @@ _T: Final = TypeVar("_T")
 # ~~~~~~~~~~~~~~~ EXCEPTIONS ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+def _lazy_syntax_error_attribute(name: str) -> property:
+	attribute = getattr(SyntaxError, name)
+
+	def __get__(self: SEPSyntaxError):
+		self._resolve_traceback()
+		return attribute.__get__(self, type(self))
+
+	def __set__(self: SEPSyntaxError, value) -> None:
+		# resolve first, otherwise a later read would overwrite the value set here
+		self._resolve_traceback()
+		attribute.__set__(self, value)
+
+	return property(__get__, __set__, doc=attribute.__doc__)
+
 class SEPSyntaxError(SyntaxError):
 	"""
 	:py:class:`SEPSyntaxError` is an error for general syntax errors raised by custom implementations in :py:mod:`SEPModules`.
@@ -43,33 +71,151 @@ class SEPSyntaxError(SyntaxError):
 	:param file_path: the path to the file where the error occurred
 	:param lineno: the line number at which the error occurred in the file
 	:param offset: the offset in characters for the syntax error 'cursor'
-	:param code_context: the code context of where the error occurred (i.e. the source code)
+	:param code_context: the code context of where the error occurred (i.e. the source code), or a function without
+		arguments which returns it; it is only retrieved once :py:attr:`text` is first accessed
 	"""
 
+	_traceback_func: Optional[Callable[[], Traceback]] = None
+	""" The function which supplies the traceback of this error, or ``None`` if it has already been resolved. """
+
+	_code_context: Union[None, List[AnyStr], Callable[[], Optional[List[AnyStr]]]] = None
+	""" The code context of this error, or ``None`` if it has already been converted to :py:attr:`text`. """
+
 	def __init__(self,
 				 msg: AnyStr,
 				 file_path: Union[AnyStr, os.PathLike],
 				 lineno: int,
 				 offset: int,
-				 code_context: List[AnyStr]):
-		super(SEPSyntaxError, self).__init__(msg, (file_path, lineno, offset, code_context))
+				 code_context: Union[List[AnyStr], Callable[[], Optional[List[AnyStr]]]]):
+		super(SEPSyntaxError, self).__init__(msg, (file_path, lineno, offset, None))
+		self._code_context = code_context
+
+	def _resolve_traceback(self) -> None:
+		traceback_func = self._traceback_func
+		if traceback_func is not None:
+			self._traceback_func = None
+			tb = traceback_func()
+			SyntaxError.__init__(self, SyntaxError.msg.__get__(self),
+								 (tb.filename, tb.lineno, SyntaxError.offset.__get__(self), None))
+			self._code_context = lambda: tb.code_context
+
+	args = _lazy_syntax_error_attribute("args")
+	filename = _lazy_syntax_error_attribute("filename")
+	lineno = _lazy_syntax_error_attribute("lineno")
+
+	@property
+	def text(self) -> Optional[AnyStr]:
+		""" The source code of where the error occurred. """
+		self._resolve_traceback()
+		code_context = self._code_context
+		if code_context is not None:
+			self._code_context = None
+			if callable(code_context):
+				code_context = code_context()
+			SyntaxError.text.__set__(self, None if code_context is None else "".join(code_context))
+		return SyntaxError.text.__get__(self, type(self))
+
+	@text.setter
+	def text(self, value: Optional[AnyStr]) -> None:
+		self._resolve_traceback()
+		self._code_context = None
+		SyntaxError.text.__set__(self, value)
+
+	def __str__(self) -> str:
+		self._resolve_traceback()
+		return super(SEPSyntaxError, self).__str__()
+
+	def __repr__(self) -> str:
+		self._resolve_traceback()
+		return super(SEPSyntaxError, self).__repr__()
 
 	@staticmethod
-	def from_traceback(msg: AnyStr, tb: Traceback, offset: int = 0) -> SEPSyntaxError:
+	def from_traceback(msg: AnyStr, tb: Union[Traceback, Callable[[], Traceback]], offset: int = 0) -> SEPSyntaxError:
 		"""
 		Creates a :py:class:`SEPSyntaxError` object from a message, traceback, and an optional offset.
 
 		:param msg: the message of the error
-		:param tb: the traceback to use as basis for the error
+		:param tb: the traceback to use as basis for the error, or a function without arguments which returns this
+			traceback; in the latter case it is only called once the location of the error is first accessed
 		:param offset: the offset in characters for the syntax error 'cursor'
 		:return: a new :py:class:`SEPSyntaxError` instance
 		"""
-		return SEPSyntaxError(msg, tb.filename, tb.lineno, offset, tb.code_context)
+		if callable(tb):
+			err = SEPSyntaxError(msg, None, None, offset, None)
+			err._traceback_func = tb
+			return err
+		return SEPSyntaxError(msg, tb.filename, tb.lineno, offset, lambda: tb.code_context)
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ IMMUTABLE ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+class _WrappedDoc:
+	"""
+	:py:class:`_WrappedDoc` is the ``__doc__`` of :py:class:`_GuardedMethod` classes. It returns the docstring of the
+	guarded method for instances, and the docstring of the class itself otherwise.
+	"""
+
+	__slots__ = ("_doc",)
+
+	def __init__(self, doc: Optional[AnyStr]):
+		self._doc = doc
+
+	def __get__(self, instance, owner=None) -> Optional[AnyStr]:
+		return self._doc if instance is None else instance._func.__doc__
+
+class _GuardedMethod:
+	"""
+	:py:class:`_GuardedMethod` is a descriptor which wraps the method ``func`` of a class, such that a guard can be
+	checked in :py:meth:`__call__` before ``func`` is called with the instance it was retrieved from. The name follows
+	the same form as the one given by :py:func:`SEPDecorators.copy_func_attrs`.
+
+	:param func: the method to guard
+	:param action: a description of what calling ``func`` does, for use in error messages
+	:param stack_depth: how far back into the stack the caller of this method lies, for use in error messages
+	:param wrapper_name: together with :py:data:`SEPDecorators.WRAPPER_PREFIX` this will be prefixed to the name
+	"""
+
+	__slots__ = ("_func", "_action", "_stack_depth", "__name__", "__wrapped__")
+
+	def __init__(self, func: Callable[..., _T], action: AnyStr, stack_depth: int, wrapper_name: AnyStr):
+		self._func = func
+		self._action = action
+		self._stack_depth = stack_depth
+		self.__name__ = f"{WRAPPER_PREFIX}_{wrapper_name}_{func.__name__}"
+		self.__wrapped__ = func
+
+	def __init_subclass__(cls, **kwargs) -> None:
+		super(_GuardedMethod, cls).__init_subclass__(**kwargs)
+		cls.__doc__ = _WrappedDoc(cls.__dict__.get("__doc__"))
+
+	def __get__(self, instance, owner=None):
+		return self if instance is None else MethodType(self, instance)
+
+	def __call__(self, instance, *args, **kwargs) -> _T:
+		raise abstract_not_implemented(_GuardedMethod, "__call__")
+
+	@classmethod
+	def wraps(cls, owner: Type, name: str) -> bool:
+		""" Checks if the attribute ``name`` resolved by ``owner`` is already wrapped by this guard, e.g. if inherited. """
+		return isinstance(getattr_static(owner, name, None), cls)
+
+class _LockedMethod(_GuardedMethod):
+	""" :py:class:`_LockedMethod` guards the methods of :py:class:`Immutable` classes once they are locked. """
+
+	__slots__ = ()
+
+	def __call__(self, instance, *args) -> _T:
+		# only '__setattr__' and '__delattr__' are locked, which do not take keyword arguments
+		locked = instance.__dict__.get("_locked")
+		if locked is None:
+			# subclasses may keep '_locked' in their '__slots__' instead of the instance dict
+			locked = getattr(instance, "_locked", False)
+		if not locked:
+			return self._func(instance, *args)
+		raise SEPSyntaxError.from_traceback(f"Cannot {self._action} immutable class {type(instance).__name__!r}",
+											_lazy_traceback(self._stack_depth + 1))
+
 class ImmutableMeta(abc.ABCMeta, type):
 	"""
 	:py:class:`ImmutableMeta` is the meta class behind the mechanism of the :py:class:`Immutable` abstract base class.
@@ -78,22 +224,14 @@ class ImmutableMeta(abc.ABCMeta, type):
 	def __new__(cls, *args, **kwargs):
 		new_cls = super(ImmutableMeta, cls).__new__(cls, *args, **kwargs)
 
-		new_cls.__setattr__ = new_cls._lock_method(new_cls, new_cls.__setattr__, "set attribute for", 0)
-		new_cls.__delattr__ = new_cls._lock_method(new_cls, new_cls.__delattr__, "delete attribute of", 0)
+		# only lock methods which are not already locked by a parent class
+		if not _LockedMethod.wraps(new_cls, "__setattr__"):
+			new_cls.__setattr__ = _LockedMethod(new_cls.__setattr__, "set attribute for", 0, "locked")
+		if not _LockedMethod.wraps(new_cls, "__delattr__"):
+			new_cls.__delattr__ = _LockedMethod(new_cls.__delattr__, "delete attribute of", 0, "locked")
 
 		return new_cls
 
-	@staticmethod
-	def _lock_method(cls: Type, func: Callable[..., _T], action: AnyStr, stack_depth: int) -> Callable[..., _T]:
-		def __lock__(self, *args, **kwargs) -> _T:
-			if getattr(self, "_locked", False):
-				raise SEPSyntaxError.from_traceback(f"Cannot {action} immutable class {cls.__name__!r}",
-													SingleStackFrameInfo()[stack_depth + 1])
-			else:
-				return func(self, *args, **kwargs)
-
-		return copy_func_attrs(__lock__, func, "locked")
-
 	def __call__(cls, *args, **kwargs):
 		new = super(ImmutableMeta, cls).__call__(*args, **kwargs)
 		new._locked = True
@@ -110,6 +248,22 @@ class Immutable(abc.ABC, metaclass=ImmutableMeta):
 # ~~~~~~~~~~~~~~~ SINGLETON ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+class _SingletonGuardedMethod(_GuardedMethod):
+	""" :py:class:`_SingletonGuardedMethod` guards the methods of :py:class:`Singleton` classes once instantiated. """
+
+	__slots__ = ()
+
+	def __call__(self, instance, *args, **kwargs) -> _T:
+		cls = type(instance)
+		if cls.__dict__.get("_instance") is not None:
+			raise cls._singleton_error(self._action, stack_depth=self._stack_depth + 1)
+		return self._func(instance, *args, **kwargs)
+
+_SINGLETON_GUARDED_ACTIONS: Final[Dict[str, str]] = {"__init__"   : "initialize more than one",
+													 "__setattr__": "set attribute for",
+													 "__delattr__": "delete attribute of"}
+""" The methods guarded on every :py:class:`Singleton` class, mapped to the action named in the error message. """
+
 class SingletonMeta(abc.ABCMeta, type):
 	"""
 	:py:class:`SingletonMeta` is the meta class behind the mechanics of the :py:class:`Singleton` abstract base class.
@@ -117,38 +271,34 @@ class SingletonMeta(abc.ABCMeta, type):
 
 	_instance: ClassVar[Singleton] = None
 	""" The singleton instance for each class. """
+	_error_template: ClassVar[str]
+	""" The error message for each class, with the ``action`` left to be formatted in. """
 
 	def __new__(cls, *args, **kwargs):
 		new_cls = super(SingletonMeta, cls).__new__(cls, *args, **kwargs)
+		# escape the class name, it must not be read as a replacement field
+		escaped_name = repr(new_cls.__name__).replace("{", "{{").replace("}", "}}")
+		new_cls._error_template = f"Cannot {{action}} Singleton object of type {escaped_name}, " \
+								  f"already created instance {{instance!r}}"
 
-		# guard some methods of new class
-		new_cls.__init__ = new_cls.__guard_method(new_cls.__init__, "initialize more than one", stack_depth=0)
-		new_cls.__setattr__ = new_cls.__guard_method(new_cls.__setattr__, "set attribute for", stack_depth=0)
-		new_cls.__delattr__ = new_cls.__guard_method(new_cls.__delattr__, "delete attribute of", stack_depth=0)
+		# guard some methods of new class, unless they are already guarded by a parent class
+		for name, action in _SINGLETON_GUARDED_ACTIONS.items():
+			if not _SingletonGuardedMethod.wraps(new_cls, name):
+				setattr(new_cls, name, _SingletonGuardedMethod(getattr(new_cls, name), action, 0, "singleton_guard"))
 
 		return new_cls
 
 	def __call__(cls, *args, **kwargs):
-		cls.__singleton_guard("instantiate", stack_depth=1)
-		return cls.__get_instance(*args, **kwargs)
-
-	def __singleton_guard(cls, action: str, stack_depth: int) -> None:
-		if cls._instance is not None:
-			frame = SingleStackFrameInfo()[stack_depth + 1]
-			raise SEPSyntaxError.from_traceback(f"Cannot {action} Singleton object of type {cls.__name__!r}, "
-												f"already created instance {repr(cls._instance)!r}", frame)
+		if cls.__dict__.get("_instance") is not None:
+			raise cls._singleton_error("instantiate", stack_depth=1)
+		instance = super(SingletonMeta, cls).__call__(*args, **kwargs)
+		cls._instance = instance
+		return instance
 
-	def __guard_method(cls, func: Callable[..., _T], action: str, stack_depth: int) -> Callable[..., _T]:
-		def __wrapper__(*args, **kwargs) -> _T:
-			cls.__singleton_guard(action, stack_depth=stack_depth + 1)
-			return func(*args, **kwargs)
-
-		return copy_func_attrs(__wrapper__, func, "singleton_guard")
-
-	def __get_instance(cls, *args, **kwargs):
-		if cls._instance is None:
-			cls._instance = super(SingletonMeta, cls).__call__(*args, **kwargs)
-		return cls._instance
+	def _singleton_error(cls, action: str, stack_depth: int) -> SEPSyntaxError:
+		return SEPSyntaxError.from_traceback(cls._error_template.format(action=action,
+																		instance=repr(cls.__dict__.get("_instance"))),
+											 _lazy_traceback(stack_depth + 1))
 
 class Singleton(abc.ABC, metaclass=SingletonMeta):
 	"""
@@ -164,7 +314,7 @@ class Singleton(abc.ABC, metaclass=SingletonMeta):
 	@final
 	def get_instance(cls) -> Optional[Singleton]:
 		""" Retrieve the singleton instance of this singleton class, or ``None`` if it has not been instantiated yet. """
-		return getattr(cls, "_instance", None)
+		return cls.__dict__.get("_instance")
 
 	@final
 	def __init_subclass__(cls, **kwargs) -> None:
@@ -173,13 +323,67 @@ class Singleton(abc.ABC, metaclass=SingletonMeta):
 												 lambda _cls: SEPSyntaxError.from_traceback(
 													 f"Cannot subclass singleton class {cls.__name__!r}, "
 													 f"offending class is {_cls.__name__!r}",
-													 SingleStackFrameInfo()[4])
+													 _DEFAULT_SINGLE_STACK_FRAME_INFO[4])
 												 ))
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ STACK FRAME ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+def _source_line(file_path: AnyStr, lineno: int, module_globals: Optional[Dict[str, Any]]) -> Optional[AnyStr]:
+	# 'linecache' caches the lines itself, but like 'inspect.findsource' make sure the file has not changed since
+	linecache.checkcache(file_path)
+	line = linecache.getline(file_path, lineno, module_globals)
+	return line if line else None
+
+def _linecache_globals(module_globals: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+	# only keep what 'linecache' needs to ask the module loader for the source, not the entire namespace
+	if module_globals is None:
+		return None
+	return {key: module_globals[key] for key in ("__name__", "__loader__", "__spec__") if key in module_globals}
+
+@lru_cache(maxsize=1024)
+def _short_file_path(file_path: AnyStr, cwd: AnyStr) -> AnyStr:
+	# try to shorten file path
+	raw_file_path, raw_cwd = path.abspath(path.realpath(file_path)), path.abspath(path.realpath(cwd))
+	if path.normcase(path.splitdrive(raw_file_path)[0]) != path.normcase(path.splitdrive(raw_cwd)[0]):
+		# if Windows then different drive letters have no relative path -> absolute path instead
+		return raw_file_path
+	short_file_path = path.relpath(raw_file_path, start=raw_cwd)
+	# check if new path is actually shorter
+	return raw_file_path if len(short_file_path) > len(raw_file_path) else short_file_path
+
+def _code_traceback(code: CodeType,
+					lasti: int,
+					lineno: int,
+					cwd: AnyStr,
+					module_globals: Optional[Dict[str, Any]] = None) -> Traceback:
+	key = (id(code), lasti, cwd)
+	entry = _TRACEBACK_CACHE.pop(key, None)
+	# the id of a collected code object may be reused, so the entry has to refer to this exact code object
+	if (entry is None) or (entry[0]() is not code):
+		# the line is read once here, the traceback then serves every further lookup of this location
+		line = _source_line(code.co_filename, lineno, module_globals)
+		entry = (weakref.ref(code), Traceback(_short_file_path(code.co_filename, cwd), lineno, code.co_name,
+											  None if line is None else [line], None if line is None else 0))
+		if len(_TRACEBACK_CACHE) >= _TRACEBACK_CACHE_SIZE:
+			# evict the oldest entry
+			_TRACEBACK_CACHE.pop(next(iter(_TRACEBACK_CACHE)), None)
+	_TRACEBACK_CACHE[key] = entry
+	return entry[1]
+
+def _make_traceback(frame: FrameType, cwd: AnyStr) -> Traceback:
+	return _code_traceback(frame.f_code, frame.f_lasti, frame.f_lineno, cwd, frame.f_globals)
+
+def _lazy_traceback(depth: int) -> Callable[[], Traceback]:
+	# the location has to be captured right away, only creating the traceback is deferred
+	frame = sys._getframe(depth + 1)
+	try:
+		return partial(_code_traceback, frame.f_code, frame.f_lasti, frame.f_lineno, os.getcwd(),
+					   _linecache_globals(frame.f_globals))
+	finally:
+		del frame
+
 class StackFrameInfo:
 	"""
 	:py:class:`StackFrameInfo` is a convenient way to *safely* retrieve ``Traceback`` objects from the stack. It only
@@ -194,6 +398,8 @@ class StackFrameInfo:
 	:param __offset: how much to offset the start of the stack, this only affects the container syntax, defaults to 2
 	"""
 
+	__slots__ = ("_offset",)
+
 	def __init__(self, __offset: int = 2):
 		if not isinstance(__offset, int):
 			raise TypeError(f"'__offset' must be an int, but received {__offset.__class__.__name__!r}")
@@ -203,30 +409,35 @@ class StackFrameInfo:
 
 	@staticmethod
 	def get_tracebacks(index: slice) -> Tuple[Traceback]:
+		start, stop, step = index.start, index.stop, index.step
+		frame, frames = None, list()
 		try:
-			_tracebacks = list()
-			# loop over all stacks
-			for st in stack()[index]:
+			if any((i is not None) and (i < 0) for i in (start, stop)) or ((step is not None) and (step < 1)):
+				# negative indices or steps need the entire stack, 0 is this frame like for 'inspect.stack'
+				frame = sys._getframe(0)
+				while frame is not None:
+					frames.append(frame)
+					frame = frame.f_back
+				frames = frames[index]
+			else:
+				# only walk as far up the stack as the slice requires
+				start, step = start or 0, step or 1
 				try:
-					tb = getframeinfo(st[0])
-					# try to shorten file path
-					raw_file_path = path.abspath(path.realpath(tb.filename))
-					try:
-						file_path = path.relpath(raw_file_path, start=path.abspath(path.realpath(os.getcwd())))
-					except ValueError:
-						# if Windows then different drive letters will cause an error -> absolute path instead
-						file_path = raw_file_path
-					# check if new path is actually shorter
-					if len(file_path) > len(raw_file_path):
-						file_path = raw_file_path
-
-					_tracebacks.append(Traceback(file_path, tb.lineno, tb.function, tb.code_context, tb.index))
-				finally:
-					# delete stack info for safety reasons
-					del tb, st
-			return tuple(_tracebacks)
+					frame = sys._getframe(start)
+				except ValueError:
+					# stack is not deep enough
+					frame = None
+				i = start
+				while (frame is not None) and ((stop is None) or (i < stop)):
+					if (i - start) % step == 0:
+						frames.append(frame)
+					frame = frame.f_back
+					i += 1
+			cwd = os.getcwd()
+			return tuple(_make_traceback(frame, cwd) for frame in frames)
 		finally:
-			del _tracebacks
+			# delete frame references for safety reasons
+			del frame, frames
 
 	def __getitem__(self, item: Union[int, slice]) -> Tuple[Traceback]:
 		if isinstance(item, int):
@@ -242,16 +453,38 @@ class SingleStackFrameInfo(StackFrameInfo):
 	instead of a tuple. See :py:class:`StackFrameInfo` for more details.
 	"""
 
+	__slots__ = ()
+
 	def __getitem__(self, item: int) -> Traceback:
 		if not isinstance(item, int):
 			raise TypeError(f"'SingleStackFrameInfo' only accepts an int index, "
 							f"but received {item.__class__.__name__!r}")
-		return self.get_tracebacks(slice(item + self._offset, item + self._offset + 1))[0]
+		# index 0 of 'get_tracebacks' is its own frame, so this frame is at index 1
+		depth = item + self._offset - 1
+		if depth < 0:
+			return self.get_tracebacks(slice(item + self._offset, item + self._offset + 1))[0]
+		try:
+			frame = sys._getframe(depth)
+		except ValueError:
+			raise IndexError(f"Stack is not deep enough to retrieve traceback at index {item!r}") from None
+		try:
+			return _make_traceback(frame, os.getcwd())
+		finally:
+			# delete frame reference for safety reasons
+			del frame
+
+_DEFAULT_SINGLE_STACK_FRAME_INFO: Final[SingleStackFrameInfo] = SingleStackFrameInfo()
+""" Shared :py:class:`SingleStackFrameInfo` with the default offset, it holds no state besides that. """
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ FUNCTIONS ~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+@lru_cache(maxsize=256)
+def _abstract_not_implemented_message(cls_name: str, name: str) -> str:
+	# keyed on the class name only, so that no class objects are kept alive by the cache
+	return f"Abstract method {name!r} must be implemented for class {cls_name!r}"
+
 def abstract_not_implemented(cls: Type, name: str) -> NotImplementedError:
 	""" Returns a NotImplementedError to raise for when an abstract method is not implemented for a class. """
-	return NotImplementedError(f"Abstract method {name!r} must be implemented for class {cls.__name__!r}")
+	return NotImplementedError(_abstract_not_implemented_message(cls.__name__, name))
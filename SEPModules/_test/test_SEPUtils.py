@@ -0,0 +1,215 @@
+"""
+:Author: Marcel Simader
+:Date: 16.10.2026
+"""
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# ~~~~~~~~~~~~~~~ IMPORTS ~~~~~~~~~~~~~~~
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+import gc
+import sys
+import unittest
+import weakref
+from inspect import getattr_static
+
+from SEPModules.SEPUtils import StackFrameInfo, SingleStackFrameInfo, SEPSyntaxError, Immutable, Singleton
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# ~~~~~~~~~~~~~~~ TESTS ~~~~~~~~~~~~~~~
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class TestStackFrameInfo(unittest.TestCase):
+
+	def __outer(self, info, item):
+		return self.__inner(info, item), sys._getframe().f_lineno
+
+	@staticmethod
+	def __inner(info, item):
+		return info[item], sys._getframe().f_lineno
+
+	def test_single(self):
+		(tb, inner_lineno), outer_lineno = self.__outer(SingleStackFrameInfo(), 0)
+		self.assertEqual("__inner", tb.function)
+		self.assertEqual(inner_lineno, tb.lineno)
+		self.assertIn("info[item]", tb.code_context[0])
+		self.assertTupleEqual((tb.filename, tb.lineno, tb.function, tb.code_context, tb.index), tuple(tb))
+
+		(tb, _), outer_lineno = self.__outer(SingleStackFrameInfo(), 1)
+		self.assertEqual("__outer", tb.function)
+		self.assertEqual(outer_lineno, tb.lineno)
+
+	def test_slice(self):
+		(tbs, _), _ = self.__outer(StackFrameInfo(), slice(0, 3))
+		self.assertListEqual(["__inner", "__outer", "test_slice"], [tb.function for tb in tbs])
+
+		(tbs, _), _ = self.__outer(StackFrameInfo(), slice(0, 3, 2))
+		self.assertListEqual(["__inner", "test_slice"], [tb.function for tb in tbs])
+
+		(tbs, _), _ = self.__outer(StackFrameInfo(), slice(sys.getrecursionlimit(), sys.getrecursionlimit() + 1))
+		self.assertTupleEqual(tuple(), tbs)
+
+	def test_get_tracebacks(self):
+		tbs = StackFrameInfo.get_tracebacks(slice(1, 2))
+		self.assertEqual(1, len(tbs))
+		self.assertEqual("test_get_tracebacks", tbs[0].function)
+
+		tbs = StackFrameInfo.get_tracebacks(slice(-2, None))
+		self.assertEqual(2, len(tbs))
+		self.assertTupleEqual(StackFrameInfo.get_tracebacks(slice(0, None))[-2:], tbs)
+
+		self.assertRaises(TypeError, lambda: StackFrameInfo.get_tracebacks(slice("a", None)))
+
+	def test_cache_references(self):
+		class _Marker:
+			pass
+
+		namespace = {"StackFrameInfo": StackFrameInfo, "_Marker": _Marker}
+		code = compile("marker = _Marker()\ntbs = StackFrameInfo()[0:1]", "<test_cache_references>", "exec")
+		exec(code, namespace)
+		self.assertEqual("<module>", namespace["tbs"][0].function)
+
+		marker, code = weakref.ref(namespace["marker"]), weakref.ref(code)
+		del namespace
+		gc.collect()
+		self.assertIsNone(marker())
+		self.assertIsNone(code())
+
+	def test_offset(self):
+		self.assertRaises(TypeError, lambda: StackFrameInfo("2"))
+		self.assertRaises(ValueError, lambda: StackFrameInfo(-1))
+		self.assertRaises(TypeError, lambda: SingleStackFrameInfo()[slice(0, 1)])
+
+class TestSEPSyntaxError(unittest.TestCase):
+
+	def test_from_traceback(self):
+		tb = SingleStackFrameInfo()[0]
+		err = SEPSyntaxError.from_traceback("message", tb, offset=3)
+		self.assertEqual("message", err.msg)
+		self.assertEqual(tb.filename, err.filename)
+		self.assertEqual(tb.lineno, err.lineno)
+		self.assertEqual(3, err.offset)
+		self.assertEqual("".join(tb.code_context), err.text)
+		self.assertTupleEqual(("message", (tb.filename, tb.lineno, 3, None)), err.args)
+
+	def test_lazy_from_traceback(self):
+		tb, calls = SingleStackFrameInfo()[0], list()
+
+		def __traceback__():
+			calls.append(tb)
+			return tb
+
+		err = SEPSyntaxError.from_traceback("message", __traceback__)
+		self.assertListEqual([], calls)
+		self.assertEqual(tb.lineno, err.lineno)
+		self.assertListEqual([tb], calls)
+		self.assertIn("SingleStackFrameInfo()[0]", err.text)
+		self.assertIn(f"line {tb.lineno}", str(err))
+		self.assertListEqual([tb], calls)
+
+	def test_lazy_set(self):
+		tb = SingleStackFrameInfo()[0]
+
+		err = SEPSyntaxError.from_traceback("message", lambda: tb)
+		self.assertIn(repr(tb.lineno), repr(err))
+
+		err = SEPSyntaxError.from_traceback("message", lambda: tb)
+		err.lineno = tb.lineno + 10
+		self.assertEqual(tb.lineno + 10, err.lineno)
+
+		err = SEPSyntaxError.from_traceback("message", lambda: tb)
+		err.text = "custom"
+		self.assertEqual("custom", err.text)
+		self.assertEqual(tb.lineno, err.lineno)
+
+class TestImmutable(unittest.TestCase):
+
+	class _Base(Immutable):
+
+		def __init__(self, value):
+			self.value = value
+
+		def __setattr__(self, key, value):
+			""" Sets the attribute. """
+			super().__setattr__(key, value)
+
+	class _Sub(_Base):
+		pass
+
+	def test_set_del(self):
+		immutable = self._Base(1)
+		with self.assertRaises(SEPSyntaxError) as context:
+			lineno = sys._getframe().f_lineno + 1
+			immutable.value = 2
+		self.assertEqual(lineno, context.exception.lineno)
+		self.assertIn("immutable.value = 2", context.exception.text)
+
+		with self.assertRaises(SEPSyntaxError) as context:
+			lineno = sys._getframe().f_lineno + 1
+			del immutable.value
+		self.assertEqual(lineno, context.exception.lineno)
+		self.assertEqual(1, immutable.value)
+
+	def test_slots(self):
+		class _Slotted(Immutable):
+			__slots__ = ("_locked", "value")
+
+			def __init__(self, value):
+				self.value = value
+
+		slotted = _Slotted(1)
+		with self.assertRaises(SEPSyntaxError):
+			slotted.value = 2
+		with self.assertRaises(SEPSyntaxError):
+			del slotted.value
+		self.assertEqual(1, slotted.value)
+
+	def test_subclass(self):
+		self.assertIs(getattr_static(self._Base, "__setattr__"), getattr_static(self._Sub, "__setattr__"))
+		self.assertIs(getattr_static(self._Base, "__delattr__"), getattr_static(self._Sub, "__delattr__"))
+		self.assertEqual(2, self._Sub(2).value)
+
+	def test_doc(self):
+		self.assertEqual(" Sets the attribute. ", self._Base.__setattr__.__doc__)
+		self.assertEqual(" Sets the attribute. ", self._Base(1).__setattr__.__doc__)
+
+class TestSingleton(unittest.TestCase):
+
+	def test_instantiate(self):
+		class _Single(Singleton):
+			pass
+
+		self.assertIsNone(_Single.get_instance())
+		instance = _Single()
+		self.assertIs(instance, _Single.get_instance())
+		with self.assertRaises(SEPSyntaxError) as context:
+			lineno = sys._getframe().f_lineno + 1
+			_Single()
+		self.assertEqual(lineno, context.exception.lineno)
+
+		with self.assertRaises(SEPSyntaxError) as context:
+			lineno = sys._getframe().f_lineno + 1
+			instance.value = 1
+		self.assertEqual(lineno, context.exception.lineno)
+
+	def test_subclass(self):
+		class _Single(Singleton):
+			pass
+
+		with self.assertRaises(SEPSyntaxError) as context:
+			lineno = sys._getframe().f_lineno + 1
+			class _SubSingle(_Single):
+				pass
+		self.assertEqual(lineno, context.exception.lineno)
+		self.assertIn("_SubSingle", context.exception.msg)
+
+	def test_error_message(self):
+		_Single = type("_Single{name}", (Singleton,), dict())
+		instance = _Single()
+		with self.assertRaises(SEPSyntaxError) as context:
+			_Single()
+		self.assertEqual(f"Cannot instantiate Singleton object of type '_Single{{name}}', "
+						 f"already created instance {repr(instance)!r}", context.exception.msg)
+
+if __name__ == "__main__":
+	raise NotImplementedError()
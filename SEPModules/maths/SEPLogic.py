@@ -59,7 +59,8 @@ class LogicSyntaxError(SEPSyntaxError, LogicError):
 	:param file_path: the path to the file where the error occurred
 	:param lineno: the line number at which the error occurred in the file
 	:param offset: the offset in characters for the syntax error 'cursor'
-	:param code_context: the code context of where the error occurred (i.e. the source code)
+	:param code_context: the code context of where the error occurred (i.e. the source code), or a function without
+		arguments which returns it
 	"""
 
 	def __init__(self,
@@ -68,7 +69,7 @@ class LogicSyntaxError(SEPSyntaxError, LogicError):
 				 file_path: Union[AnyStr, os.PathLike],
 				 lineno: int,
 				 offset: int,
-				 code_context: List[AnyStr]):
+				 code_context: Union[List[AnyStr], Callable[[], Optional[List[AnyStr]]]]):
 		LogicError.__init__(self, msg, proposition)
 		SEPSyntaxError.__init__(self, f"{msg} (raised for {proposition!r})", file_path, lineno, offset, code_context)
 
@@ -83,7 +84,7 @@ class LogicSyntaxError(SEPSyntaxError, LogicError):
 		:param offset: the offset in characters for the syntax error 'cursor'
 		:return: a new :py:class:`SEPSyntaxError` instance
 		"""
-		return LogicSyntaxError(msg, proposition, tb.filename, tb.lineno, offset, tb.code_context)
+		return LogicSyntaxError(msg, proposition, tb.filename, tb.lineno, offset, lambda: tb.code_context)
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~~~~~~~~~~~~~~ CONNECTIVE BASES ~~~~~~~~~~~~~~~